@@ -4,3 +4,4 @@ __author__ = "Alex Raskin"
 __license__ = "MIT"
 
 from .client import Client, AsyncClient
+from .errors import CloudflareURLScanError
@@ -1,12 +1,20 @@
 import os
+import asyncio
 import httpx
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Literal
+from typing import AsyncIterator, Iterator, Optional, Literal, Union
 
 from .builder import UrlBuilder
-from .helpers import create_request_body
+from .errors import CloudflareURLScanError
+from .helpers import create_request_body, format_search_dates
 from .response import CloudflareURLScanResponse
 
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0
+)
+
 
 class Client:
     """
@@ -20,6 +28,7 @@ class Client:
         cloudflare_api_key: Optional[str] = None,
         cloudflare_account_id: Optional[str] = None,
         timeout: Optional[int] = 60,
+        warmup: bool = False,
     ) -> None:
         """
         Parameters:
@@ -30,25 +39,55 @@ class Client:
             The Cloudflare account ID.
         timeout : int (optional)
             The timeout for the requests (default is 60 seconds)
+        warmup : bool (optional)
+            Open the connection to the API during construction (default is False).
+            When enabled, network errors (DNS, TLS, timeouts) are raised from the constructor.
 
         """
-        if cloudflare_api_key is None:
-            self.cloudflare_api_key = os.getenv("CLOUDFLARE_API_KEY")
-        self.cloudflare_api_key = cloudflare_api_key
-
-        if cloudflare_account_id is None:
-            self.cloudflare_account_id = os.getenv("CLOUDFLARE_ACCOUNT_ID")
-        self.cloudflare_account_id = cloudflare_account_id
+        self.cloudflare_api_key = cloudflare_api_key or os.getenv("CLOUDFLARE_API_KEY")
+        if not self.cloudflare_api_key:
+            raise ValueError(
+                "No Cloudflare API key provided. Pass cloudflare_api_key or set CLOUDFLARE_API_KEY."
+            )
+
+        self.cloudflare_account_id = cloudflare_account_id or os.getenv(
+            "CLOUDFLARE_ACCOUNT_ID"
+        )
+        if not self.cloudflare_account_id:
+            raise ValueError(
+                "No Cloudflare account ID provided. Pass cloudflare_account_id or set CLOUDFLARE_ACCOUNT_ID."
+            )
 
         self._timeout = timeout
-        self._http_client = httpx.Client(timeout=self._timeout)
-        self._url_builder = UrlBuilder(self.cloudflare_account_id)  # type: ignore
-
-    def _build_headers(self) -> dict[str, str]:
-        return {
-            "ContentType": "application/json",
+        self._headers = {
+            "Content-Type": "application/json",
             "Authorization": f"Bearer {self.cloudflare_api_key}",
         }
+        self._http_client = httpx.Client(
+            http2=True,
+            timeout=self._timeout,
+            limits=_HTTP_LIMITS,
+            headers=self._headers,
+        )
+        self._url_builder = UrlBuilder(self.cloudflare_account_id)
+        if warmup:
+            try:
+                self.warmup()
+            except Exception:
+                self._http_client.close()
+                raise
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def warmup(self) -> None:
+        """
+        Establish the TLS and HTTP/2 session ahead of the first real request.
+        """
+        self._http_client.head(self._url_builder.build_base_url())
 
     def _http(
         self,
@@ -59,9 +98,8 @@ class Client:
         """
         Make an HTTP request to the Cloudflare API.
         """
-        return self._http_client.request(
-            method=method, url=url, headers=self._build_headers(), json=data
-        )
+        content = orjson.dumps(data) if data is not None else None
+        return self._http_client.request(method=method, url=url, content=content)
 
     def scan(
         self,
@@ -121,6 +159,28 @@ class Client:
         )
         return CloudflareURLScanResponse(response=response)
 
+    def get_scans(self, uuids: list[str]) -> list[CloudflareURLScanResponse]:
+        """
+        Get several scans by UUID, issuing the requests concurrently over the connection pool.
+
+        Parameters:
+        uuids : list[str]
+            The UUIDs of the scans.
+
+        Returns:
+        list[CloudflareURLScanResponse]
+            The responses from the API, in the same order as `uuids`.
+        """
+        urls = [self._url_builder.build_get_scan_url(uuid=uuid) for uuid in uuids]
+        if not urls:
+            return []
+        workers = min(len(urls), _HTTP_LIMITS.max_keepalive_connections)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            responses = executor.map(
+                lambda url: self._http(method="GET", url=url), urls
+            )
+            return [CloudflareURLScanResponse(response=r) for r in responses]
+
     def get_screen_shots(
         self, uuid: str, resolution: Literal["desktop", "mobile", "table"]
     ) -> CloudflareURLScanResponse:
@@ -166,8 +226,8 @@ class Client:
         self,
         scanId: Optional[str] = None,
         account_scans: Optional[str] = None,
-        date_end: Optional[datetime] = None,
-        date_start: Optional[datetime] = None,
+        date_end: Optional[Union[datetime, str]] = None,
+        date_start: Optional[Union[datetime, str]] = None,
         hostname: Optional[str] = None,
         ip: Optional[str] = None,
         limit: Optional[int] = None,
@@ -190,9 +250,9 @@ class Client:
 
         account_scans: boolean: Return only scans created by account.
 
-        date_end: string <date-time>: Filter scans requested before date (inclusive).
+        date_end: datetime or ISO 8601 string <date-time>: Filter scans requested before date (inclusive).
 
-        date_start: string <date-time>: Filter scans requested after date (inclusive).
+        date_start: datetime or ISO 8601 string <date-time>: Filter scans requested after date (inclusive).
 
         hostname: string: Filter scans by hostname of any request made by the webpage.
 
@@ -237,6 +297,40 @@ class Client:
         response = self._http(method="GET", url=url)
         return CloudflareURLScanResponse(response=response)
 
+    def iter_search(self, **params) -> Iterator[dict]:
+        """
+        Iterate over search results, following `next_cursor` across pages.
+        Only one page is held in memory at a time.
+
+        Parameters:
+        Accepts the same keyword arguments as `search`.
+
+        Returns:
+        Iterator[dict]
+            The individual scan results.
+
+        Raises:
+        CloudflareURLScanError
+            If a page request fails.
+        """
+        params = format_search_dates(params)
+        while True:
+            response = self.search(**params)
+            if response.data.is_error or not response.success:
+                raise CloudflareURLScanError(response)
+            tasks = response.tasks
+            yield from tasks
+            cursor = response.next_cursor
+            if not cursor or not tasks:
+                return
+            params["next_cursor"] = cursor
+
+    def close(self) -> None:
+        """
+        Close the HTTP client session.
+        """
+        self._http_client.close()
+
 
 class AsyncClient:
     """
@@ -262,38 +356,57 @@ class AsyncClient:
             The timeout for the requests (default is 60 seconds)
 
         """
-        if cloudflare_api_key is None:
-            self.cloudflare_api_key = os.getenv("CLOUDFLARE_API_KEY")
-        self.cloudflare_api_key = cloudflare_api_key
-
-        if cloudflare_account_id is None:
-            self.cloudflare_account_id = os.getenv("CLOUDFLARE_ACCOUNT_ID")
-        self.cloudflare_account_id = cloudflare_account_id
+        self.cloudflare_api_key = cloudflare_api_key or os.getenv("CLOUDFLARE_API_KEY")
+        if not self.cloudflare_api_key:
+            raise ValueError(
+                "No Cloudflare API key provided. Pass cloudflare_api_key or set CLOUDFLARE_API_KEY."
+            )
+
+        self.cloudflare_account_id = cloudflare_account_id or os.getenv(
+            "CLOUDFLARE_ACCOUNT_ID"
+        )
+        if not self.cloudflare_account_id:
+            raise ValueError(
+                "No Cloudflare account ID provided. Pass cloudflare_account_id or set CLOUDFLARE_ACCOUNT_ID."
+            )
 
         self._timeout = timeout
-        self._http_client = httpx.AsyncClient(timeout=self._timeout)
-        self._url_builder = UrlBuilder(self.cloudflare_account_id)  # type: ignore
-
-    def _build_headers(self) -> dict[str, str]:
-        return {
+        self._headers = {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.cloudflare_api_key}",
         }
+        self._http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=self._timeout,
+            limits=_HTTP_LIMITS,
+            headers=self._headers,
+        )
+        self._url_builder = UrlBuilder(self.cloudflare_account_id)
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def warmup(self) -> None:
+        """
+        Establish the TLS and HTTP/2 session ahead of the first real request.
+        """
+        await self._http_client.head(self._url_builder.build_base_url())
 
     async def _http(
         self,
         method: Literal["GET", "POST"],
         url: str,
-        headers: dict[str, str] = None,  # type: ignore
         data: dict[str, str] = None,  # type: ignore
     ) -> httpx.Response:
         """
         Make an HTTP request to the Cloudflare API.
         """
-        if headers is None:
-            headers = self._build_headers()
+        content = orjson.dumps(data) if data is not None else None
         return await self._http_client.request(
-            method=method, url=url, headers=headers, json=data
+            method=method, url=url, content=content
         )
 
     async def scan(
@@ -355,6 +468,28 @@ class AsyncClient:
         )
         return CloudflareURLScanResponse(response=response)
 
+    async def get_scans(self, uuids: list[str]) -> list[CloudflareURLScanResponse]:
+        """
+        Get several scans by UUID, issuing the requests concurrently over the connection pool.
+
+        Parameters:
+        uuids : list[str]
+            The UUIDs of the scans.
+
+        Returns:
+        list[CloudflareURLScanResponse]
+            The responses from the API, in the same order as `uuids`.
+        """
+        urls = [self._url_builder.build_get_scan_url(uuid=uuid) for uuid in uuids]
+        semaphore = asyncio.Semaphore(_HTTP_LIMITS.max_keepalive_connections)
+
+        async def fetch(url: str) -> httpx.Response:
+            async with semaphore:
+                return await self._http(method="GET", url=url)
+
+        responses = await asyncio.gather(*(fetch(url) for url in urls))
+        return [CloudflareURLScanResponse(response=r) for r in responses]
+
     async def get_screen_shots(
         self, uuid: str, resolution: Literal["desktop", "mobile", "table"]
     ) -> CloudflareURLScanResponse:
@@ -400,8 +535,8 @@ class AsyncClient:
         self,
         scanId: Optional[str] = None,
         account_scans: Optional[str] = None,
-        date_end: Optional[datetime] = None,
-        date_start: Optional[datetime] = None,
+        date_end: Optional[Union[datetime, str]] = None,
+        date_start: Optional[Union[datetime, str]] = None,
         hostname: Optional[str] = None,
         ip: Optional[str] = None,
         limit: Optional[int] = None,
@@ -424,9 +559,9 @@ class AsyncClient:
 
         account_scans: boolean: Return only scans created by account.
 
-        date_end: string <date-time>: Filter scans requested before date (inclusive).
+        date_end: datetime or ISO 8601 string <date-time>: Filter scans requested before date (inclusive).
 
-        date_start: string <date-time>: Filter scans requested after date (inclusive).
+        date_start: datetime or ISO 8601 string <date-time>: Filter scans requested after date (inclusive).
 
         hostname: string: Filter scans by hostname of any request made by the webpage.
 
@@ -471,6 +606,35 @@ class AsyncClient:
         response = await self._http(method="GET", url=url)
         return CloudflareURLScanResponse(response=response)
 
+    async def iter_search(self, **params) -> AsyncIterator[dict]:
+        """
+        Iterate over search results, following `next_cursor` across pages.
+        Only one page is held in memory at a time.
+
+        Parameters:
+        Accepts the same keyword arguments as `search`.
+
+        Returns:
+        AsyncIterator[dict]
+            The individual scan results.
+
+        Raises:
+        CloudflareURLScanError
+            If a page request fails.
+        """
+        params = format_search_dates(params)
+        while True:
+            response = await self.search(**params)
+            if response.data.is_error or not response.success:
+                raise CloudflareURLScanError(response)
+            tasks = response.tasks
+            for task in tasks:
+                yield task
+            cursor = response.next_cursor
+            if not cursor or not tasks:
+                return
+            params["next_cursor"] = cursor
+
     async def close(self) -> None:
         """
         Close the HTTP client session.
@@ -0,0 +1,13 @@
+from .response import CloudflareURLScanResponse
+
+
+class CloudflareURLScanError(Exception):
+    """
+    Raised when the Cloudflare URL Scanner API returns an unsuccessful response.
+    """
+
+    def __init__(self, response: CloudflareURLScanResponse) -> None:
+        self.response = response
+        super().__init__(
+            f"Cloudflare URL Scanner request failed with status {response.status_code}"
+        )
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Optional, Literal
 
 from .types import RequestBody
@@ -14,9 +15,14 @@ def create_request_body(
     """
     Create the request body for the Cloudflare URL Scanner API.
     """
-    body: RequestBody = {}
+    if (
+        screenshots_resolutions is None
+        and custom_user_agent is None
+        and visibility is None
+    ):
+        return {"url": url}
 
-    body["url"] = url
+    body: RequestBody = {"url": url}
 
     if screenshots_resolutions is not None:
         body["screenshotsResolutions"] = screenshots_resolutions
@@ -28,3 +34,13 @@ def create_request_body(
         body["visibility"] = visibility
 
     return body
+
+
+def format_search_dates(params: dict) -> dict:
+    """
+    Return a copy of the search parameters with datetime values converted to ISO 8601 strings.
+    """
+    return {
+        key: value.isoformat() if isinstance(value, datetime) else value
+        for key, value in params.items()
+    }
@@ -1,15 +1,26 @@
 import httpx
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, cast
 
 from .types import ScanResult
 
+_EMPTY_DICT: Mapping[str, Any] = MappingProxyType({})
+
 
 class CloudflareURLScanResponse:
     """
     Cloudflare URL Scanner API Response object.
     """
 
+    __slots__ = ("data", "_json", "_result", "_uuid", "_tasks", "_success")
+
     def __init__(self, response: httpx.Response) -> None:
         self.data = response
+        self._json: Optional[dict] = None
+        self._result: ScanResult = cast(ScanResult, {})
+        self._uuid: str = ""
+        self._tasks: list[dict[str, Any]] = []
+        self._success: bool = False
 
     def __bool__(self) -> bool:
         return self.success
@@ -20,9 +31,29 @@ class CloudflareURLScanResponse:
     def __getitem__(self, key):
         return self.json[key]
 
+    def __contains__(self, key) -> bool:
+        return key in self.json
+
+    def _load(self) -> dict:
+        """
+        Parse the body and pull out the nested fields in a single pass.
+        The body is only parsed on first access, since not every endpoint returns JSON.
+        """
+        body = self.data.json()
+        result = body.get("result", {})
+        if isinstance(result, dict):
+            self._uuid = result.get("result", _EMPTY_DICT).get("uuid", "")
+            self._tasks = result.get("tasks", [])
+        self._result = result
+        self._success = body.get("success", False)
+        self._json = body
+        return body
+
     @property
     def json(self) -> dict:
-        return self.data.json()
+        if self._json is None:
+            return self._load()
+        return self._json
 
     @property
     def text(self) -> str:
@@ -46,16 +77,39 @@ class CloudflareURLScanResponse:
 
     @property
     def result(self) -> ScanResult:
-        return self.json.get("result", {})
+        if self._json is None:
+            self._load()
+        return self._result
 
     @property
     def uuid(self) -> str:
-        return self.result.get("result", {}).get("uuid", "")
+        if self._json is None:
+            self._load()
+        return self._uuid
 
     @property
     def success(self) -> bool:
-        return self.json.get("success", False)
+        if self._json is None:
+            self._load()
+        return self._success
+
+    @property
+    def tasks(self) -> list[dict[str, Any]]:
+        if self._json is None:
+            self._load()
+        return self._tasks
 
     @property
-    def tasks(self) -> list[str]:
-        return self.json.get("result", {}).get("tasks", [])
+    def next_cursor(self) -> str:
+        return self.json.get("next_cursor", "")
+
+    def extract_columns(self) -> tuple[list[str], list[str], list[str]]:
+        """
+        Split the result rows into parallel uuid, url and time columns,
+        ready to hand to pandas or polars.
+        """
+        tasks = self.tasks
+        uuids = [task.get("uuid", "") for task in tasks]
+        urls = [task.get("url", "") for task in tasks]
+        times = [task.get("time", "") for task in tasks]
+        return uuids, urls, times
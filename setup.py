@@ -1,12 +1,20 @@
-from re import MULTILINE, search
+import ast
 
 from setuptools import setup
 
 version = ""
 with open("cloudflare_scan/__init__.py") as f:
-    version = search(
-        r'^__version__\s*=\s*[\'"]([^\'"]*)[\'"]', f.read(), MULTILINE
-    ).group(1)
+    for node in ast.parse(f.read()).body:
+        if (
+            isinstance(node, ast.Assign)
+            and isinstance(node.value, ast.Constant)
+            and any(
+                isinstance(target, ast.Name) and target.id == "__version__"
+                for target in node.targets
+            )
+        ):
+            version = node.value.value
+            break
 
 if not version:
     raise ValueError("Unable to find version string.")
@@ -29,7 +37,7 @@ setup(
     ],
     long_description_content_type="text/markdown",
     long_description=open("README.md", encoding="utf-8").read(),
-    install_requires=["httpx", "yarl"],
+    install_requires=["httpx[http2]", "orjson"],
     packages=["cloudflare_scan"],
     classifiers=[
         "Programming Language :: Python",
@@ -0,0 +1,12 @@
+from cloudflare_scan.builder import UrlBuilder
+
+
+def test_query_values_share_one_encoding():
+    builder = UrlBuilder("account")
+
+    search_url = builder.build_search_url("a b/c")
+    scan_url = builder.build_get_scan_url(page_hostname="a b/c")
+
+    assert search_url == scan_url
+    assert search_url.endswith("?page_hostname=a+b%2Fc")
+
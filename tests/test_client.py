@@ -0,0 +1,151 @@
+import asyncio
+from datetime import datetime
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+
+from cloudflare_scan import AsyncClient, Client, CloudflareURLScanError
+
+PAGES = {
+    None: {
+        "success": True,
+        "result": {"tasks": [{"uuid": "a"}, {"uuid": "b"}]},
+        "next_cursor": "page-2",
+    },
+    "page-2": {
+        "success": True,
+        "result": {"tasks": [{"uuid": "c"}]},
+        "next_cursor": "page-3",
+    },
+    "page-3": {"success": True, "result": {"tasks": []}, "next_cursor": "page-4"},
+}
+
+
+def paged_handler(request: httpx.Request) -> httpx.Response:
+    cursor = parse_qs(request.url.query.decode()).get("next_cursor", [None])[0]
+    if cursor not in PAGES:
+        return httpx.Response(500, text="unexpected page requested")
+    return httpx.Response(200, json=PAGES[cursor])
+
+
+def failing_handler(request: httpx.Request) -> httpx.Response:
+    if "next_cursor" in request.url.query.decode():
+        return httpx.Response(
+            429,
+            json={"success": False, "errors": [{"message": "rate limited"}]},
+        )
+    return httpx.Response(200, json=PAGES[None])
+
+
+def make_client(handler) -> Client:
+    client = Client(cloudflare_api_key="key", cloudflare_account_id="account")
+    client._http_client.close()
+    client._http_client = httpx.Client(
+        transport=httpx.MockTransport(handler), headers=client._headers
+    )
+    return client
+
+
+def make_async_client(handler) -> AsyncClient:
+    client = AsyncClient(cloudflare_api_key="key", cloudflare_account_id="account")
+    asyncio.run(client._http_client.aclose())
+    client._http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), headers=client._headers
+    )
+    return client
+
+
+async def collect(client: AsyncClient, **params) -> list[dict]:
+    async with client:
+        return [task async for task in client.iter_search(**params)]
+
+
+def test_iter_search_follows_cursor_until_empty_page():
+    with make_client(paged_handler) as client:
+        tasks = list(client.iter_search(page_hostname="example.com"))
+
+    assert [task["uuid"] for task in tasks] == ["a", "b", "c"]
+
+
+def test_requests_carry_auth_and_content_type_headers():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers)
+        return paged_handler(request)
+
+    with make_client(handler) as client:
+        list(client.iter_search())
+    asyncio.run(collect(make_async_client(handler)))
+
+    assert len(seen) == 6
+    for headers in seen:
+        assert headers["Authorization"] == "Bearer key"
+        assert headers["Content-Type"] == "application/json"
+
+
+def test_iter_search_raises_on_failed_page():
+    with make_client(failing_handler) as client:
+        results = client.iter_search()
+        assert next(results)["uuid"] == "a"
+        assert next(results)["uuid"] == "b"
+        with pytest.raises(CloudflareURLScanError) as excinfo:
+            next(results)
+
+    assert excinfo.value.response.status_code == 429
+    assert excinfo.value.response.errors == [{"message": "rate limited"}]
+
+
+def test_async_iter_search_follows_cursor_until_empty_page():
+    tasks = asyncio.run(collect(make_async_client(paged_handler)))
+
+    assert [task["uuid"] for task in tasks] == ["a", "b", "c"]
+
+
+def test_async_iter_search_raises_on_failed_page():
+    with pytest.raises(CloudflareURLScanError) as excinfo:
+        asyncio.run(collect(make_async_client(failing_handler)))
+
+    assert excinfo.value.response.status_code == 429
+
+
+def test_failed_warmup_closes_http_client(monkeypatch):
+    created = []
+    original_init = httpx.Client.__init__
+
+    def tracking_init(self, *args, **kwargs):
+        original_init(self, *args, **kwargs)
+        created.append(self)
+
+    def unreachable(self, url, **kwargs):
+        raise httpx.ConnectError("unreachable")
+
+    monkeypatch.setattr(httpx.Client, "__init__", tracking_init)
+    monkeypatch.setattr(httpx.Client, "head", unreachable)
+
+    with pytest.raises(httpx.ConnectError):
+        Client(cloudflare_api_key="key", cloudflare_account_id="account", warmup=True)
+
+    assert created and created[0].is_closed
+
+
+def test_iter_search_formats_dates_once():
+    class CountingDatetime(datetime):
+        calls = 0
+
+        def isoformat(self, *args, **kwargs):
+            CountingDatetime.calls += 1
+            return super().isoformat(*args, **kwargs)
+
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(parse_qs(request.url.query.decode())["date_start"])
+        return paged_handler(request)
+
+    with make_client(handler) as client:
+        list(client.iter_search(date_start=CountingDatetime(2024, 1, 1)))
+
+    assert CountingDatetime.calls == 1
+    assert seen == [["2024-01-01T00:00:00"]] * 3
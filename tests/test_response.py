@@ -0,0 +1,77 @@
+import json
+
+import httpx
+
+from cloudflare_scan.response import CloudflareURLScanResponse
+
+
+def make_response(body: dict) -> CloudflareURLScanResponse:
+    return CloudflareURLScanResponse(response=httpx.Response(200, json=body))
+
+
+def test_missing_result_is_a_plain_dict():
+    response = make_response({"success": True})
+
+    assert response.result == {}
+    assert type(response.result) is dict
+    assert json.dumps(response.result) == "{}"
+    assert response.errors == []
+    assert response.messages == []
+
+
+def test_missing_tasks_is_a_plain_list():
+    response = make_response({"success": True, "result": {}})
+
+    assert response.tasks == []
+    assert type(response.tasks) is list
+
+
+def test_nested_fields_are_extracted():
+    response = make_response(
+        {
+            "success": True,
+            "result": {"result": {"uuid": "abc"}, "tasks": [{"uuid": "abc"}]},
+        }
+    )
+
+    assert response.success
+    assert response.uuid == "abc"
+    assert response.tasks == [{"uuid": "abc"}]
+
+
+def test_null_result_falls_back_to_defaults():
+    response = make_response({"success": False, "result": None})
+
+    assert not response
+    assert response.result is None
+    assert response.uuid == ""
+    assert response.tasks == []
+
+
+def test_extract_columns_fills_missing_fields():
+    response = make_response(
+        {
+            "success": True,
+            "result": {
+                "tasks": [
+                    {"uuid": "a", "url": "https://a.example", "time": "t1"},
+                    {"uuid": "b", "time": "t2"},
+                ]
+            },
+        }
+    )
+
+    uuids, urls, times = response.extract_columns()
+
+    assert uuids == ["a", "b"]
+    assert urls == ["https://a.example", ""]
+    assert times == ["t1", "t2"]
+
+
+def test_key_access_uses_parsed_body():
+    response = make_response({"success": True, "errors": []})
+
+    assert list(response) == ["success", "errors"]
+    assert response["success"] is True
+    assert "errors" in response
+    assert "result" not in response